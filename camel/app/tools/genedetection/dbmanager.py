@@ -1,5 +1,7 @@
+import functools
 import json
 from pathlib import Path
+from typing import Any, Dict
 
 from camel.app.error.invalidinputspecificationerror import InvalidInputSpecificationError
 from camel.app.error.toolexecutionerror import ToolExecutionError
@@ -9,6 +11,18 @@ from camel.app.tools.tool import Tool
 from camel.app.utils.genedetection.mapping import Mapping
 
 
+@functools.lru_cache(maxsize=32)
+def _load_metadata(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Loads the database metadata, the modification time is part of the cache key so updated databases are reloaded.
+    :param path: Path to the metadata file
+    :param mtime_ns: Modification time of the metadata file
+    :return: Database metadata
+    """
+    with open(path) as handle:
+        return json.load(handle)
+
+
 class DBManager(Tool):
     """
     Tool that manages gene databases.
@@ -63,11 +77,11 @@ class DBManager(Tool):
         :return: None
         """
         path_metadata = input_folder / 'db_metadata.txt'
-        if not path_metadata.is_file():
+        try:
+            mtime_ns = path_metadata.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f'Database metadata not found: {path_metadata}')
-        with path_metadata.open() as handle:
-            metadata = json.load(handle)
-        self._informs.update(metadata)
+        self._informs.update(_load_metadata(str(path_metadata), mtime_ns))
         self._informs['mapping'] = self.__get_mapping(input_folder)
 
     @staticmethod
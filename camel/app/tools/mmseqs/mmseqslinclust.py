@@ -0,0 +1,73 @@
+from pathlib import Path
+from typing import List, Dict
+
+from camel.app.io.tooliofile import ToolIOFile
+from camel.app.tools.cdhit.cdhitest import Cluster
+from camel.app.tools.tool import Tool
+from camel.app.utils.command import Command
+
+
+class MMseqsLinclust(Tool):
+    """
+    MMseqs2 linclust clusters nucleotide or protein sequences in linear time.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes this tool.
+        """
+        super().__init__('mmseqs easy-linclust')
+
+    def _execute_tool(self) -> None:
+        """
+        Executes this tool.
+        :return: None
+        """
+        output_prefix = self.folder / 'out'
+        self.__build_command(output_prefix)
+        self._execute_command()
+        self._tool_outputs['FASTA'] = [ToolIOFile(output_prefix.parent / f'{output_prefix.name}_rep_seq.fasta')]
+        self._informs['clusters'] = MMseqsLinclust.__parse_clusters(
+            output_prefix.parent / f'{output_prefix.name}_cluster.tsv')
+
+    def __build_command(self, output_prefix: Path) -> None:
+        """
+        Builds the command line call.
+        :param output_prefix: Output prefix
+        :return: None
+        """
+        self._command.command = ' '.join([
+            self._tool_command,
+            'easy-linclust',
+            str(self._tool_inputs['FASTA'][0].path),
+            str(output_prefix),
+            str(self.folder / 'tmp')] + self._build_options()
+        )
+
+    @staticmethod
+    def __parse_clusters(path: Path) -> List[Cluster]:
+        """
+        Parses the cluster TSV file (representative and member sequence per line) and returns the clusters.
+        Clusters are numbered in order of appearance, using the same naming scheme as CD-HIT.
+        :param path: Path to the clusters output file.
+        :return: A list of clusters
+        """
+        cluster_by_rep: Dict[str, Cluster] = {}
+        with path.open() as handle:
+            for line in handle:
+                representative, member = line.rstrip('\n').split('\t')
+                cluster = cluster_by_rep.get(representative)
+                if cluster is None:
+                    number = len(cluster_by_rep)
+                    cluster = cluster_by_rep[representative] = Cluster(f'Cluster_{number}', number)
+                cluster.seq_ids.append(member)
+        return list(cluster_by_rep.values())
+
+    def get_version(self) -> str:
+        """
+        Returns the version of the tool.
+        :return: Tool version
+        """
+        command = Command(f'{self._tool_command} version')
+        command.run(Path().cwd(), disable_logging=True)
+        return command.stdout.strip()
@@ -1,6 +1,7 @@
 import logging
 import subprocess
 from pathlib import Path
+from typing import List, Union
 
 
 class Command(object):
@@ -8,10 +9,10 @@ class Command(object):
     Class meant to handle the execution of commands
     """
 
-    def __init__(self, command: str = None) -> None:
+    def __init__(self, command: Union[str, List[str]] = None) -> None:
         """
         Initializes the command object.
-        :param command: (optional) Command line call
+        :param command: (optional) Command line call, an argument list is executed without a shell
         """
         self._stdout = None
         self._stderr = None
@@ -44,7 +45,7 @@ class Command(object):
         return self._return_code
 
     @property
-    def command(self) -> str:
+    def command(self) -> Union[str, List[str]]:
         """
         Returns the command line call.
         :return: Command line call
@@ -52,7 +53,7 @@ class Command(object):
         return self._command
 
     @command.setter
-    def command(self, cmd: str) -> None:
+    def command(self, cmd: Union[str, List[str]]) -> None:
         """
         Sets the command line call.
         :param cmd: Command
@@ -60,26 +61,32 @@ class Command(object):
         """
         self._command = cmd
 
-    def run(self, folder: Path, stderr_handle=subprocess.PIPE, disable_logging: bool = False) -> None:
+    def run(self, folder: Path, stderr_handle=subprocess.PIPE, disable_logging: bool = False,
+            stdout_handle=subprocess.PIPE) -> None:
         """
         Runs the command given at command initialization
         :param folder: Folder where the command is executed
-        :param stderr_handle: Handle for the standard error (e.g. PIPE or STDOUT)
+        :param stderr_handle: Handle for the standard error (e.g. PIPE, STDOUT or an open file)
         :param disable_logging: If True, logging is disabled
+        :param stdout_handle: Handle for the standard output (e.g. PIPE or an open file)
         :return: None
         """
         if disable_logging is False:
             logging.info(f'Executing command: {self.command}')
         if self.command is None:
             raise ValueError("Invalid command 'None'")
+        use_shell = isinstance(self._command, str)
         self._procedure = subprocess.run(
             self._command,
-            stdout=subprocess.PIPE,
+            stdout=stdout_handle,
             stderr=stderr_handle,
-            shell=True,
-            executable='/bin/bash',
+            shell=use_shell,
+            executable='/bin/bash' if use_shell else None,
             cwd=folder)
-        self._stdout = self._procedure.stdout.decode('utf-8')
+        if self._procedure.stdout is not None:
+            self._stdout = self._procedure.stdout.decode('utf-8')
+        else:
+            self._stdout = ''
         if self._procedure.stderr is not None:
             self._stderr = self._procedure.stderr.decode('utf-8')
         else:
@@ -41,11 +41,21 @@ class FastqUtils(object):
         :param pattern: Regex to determine the sample name
         :return: Sample name
         """
-        basename = FileUtils.make_valid(Path(fastq_path).name)
-        m = re.match(pattern, basename, re.IGNORECASE)
-        if m:
-            return m.group(1)
-        raise ValueError(f"Cannot determine sample name from: {basename}")
+        sample_name = FastqUtils.__match_sample_name(fastq_path, pattern)
+        if sample_name is None:
+            raise ValueError(f"Cannot determine sample name from: {FileUtils.make_valid(Path(fastq_path).name)}")
+        return sample_name
+
+    @staticmethod
+    def __match_sample_name(fastq_path: Union[Path, str], pattern: str) -> Optional[str]:
+        """
+        Matches the sample name pattern against the given reads.
+        :param fastq_path: FASTQ path
+        :param pattern: Regex to determine the sample name
+        :return: Sample name, None if the pattern does not match
+        """
+        m = re.match(pattern, FileUtils.make_valid(Path(fastq_path).name), re.IGNORECASE)
+        return m.group(1) if m else None
 
     @staticmethod
     def get_all_read_names(fastq_path: Path) -> Set[str]:
@@ -87,10 +97,10 @@ class FastqUtils(object):
         """
         logging.debug(f"Determining sample name from: {', '.join([p.name for p in fastq_names])}")
         pattern = FastqUtils.PATTERN_FQ_PE if is_pe else FastqUtils.PATTERN_FQ_SE
-        try:
-            return FastqUtils.get_sample_name(fastq_names[0], pattern)
-        except ValueError:
-            logging.debug("Filename does not match any standard FASTQ format")
+        sample_name = FastqUtils.__match_sample_name(fastq_names[0], pattern)
+        if sample_name is not None:
+            return sample_name
+        logging.debug("Filename does not match any standard FASTQ format")
 
         # Trimmomatic output files
         m = re.search(r'.+ on {}'.format(pattern), fastq_names[0].name)
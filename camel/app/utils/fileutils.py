@@ -11,6 +11,9 @@ from typing import List, Any
 
 from camel.app.utils.command import Command
 
+# Characters that are removed by FileUtils.make_valid
+_PATTERN_INVALID_CHARS = re.compile(r'[^\w\-_\\.]')
+
 
 class FileUtils(object):
     """
@@ -27,7 +30,7 @@ class FileUtils(object):
         :return: URL- and filename friendly value
         """
         value = value.replace(' ', '_')
-        return "".join([c for c in value if re.match(r'[\w\-_\\.]', c)])
+        return _PATTERN_INVALID_CHARS.sub('', value)
 
     @staticmethod
     def get_file_with_extension(input_folder: Path, extension: str) -> Path:
@@ -149,14 +152,14 @@ class FileUtils(object):
         :param output_path: Filename of the output
         :return: None
         """
-        def get_hook(file):
-            if FileUtils.is_gzipped(file):
-                return lambda file_name, mode: gzip.open(file_name, mode='rt')
-            else:
-                return open
+        is_gzipped = FileUtils.is_gzipped(input_files[0])
+        if is_gzipped:
+            hook = lambda file_name, mode: gzip.open(file_name, mode='rt')
+        else:
+            hook = open
 
-        fin = fileinput.input(input_files, openhook=get_hook(input_files[0]))
-        output_fn = gzip.open if FileUtils.is_gzipped(input_files[0]) else open
+        fin = fileinput.input(input_files, openhook=hook)
+        output_fn = gzip.open if is_gzipped else open
         with output_fn(output_path, 'wt') as fout:
             for line in fin:
                 fout.write(line)
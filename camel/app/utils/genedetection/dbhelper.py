@@ -1,8 +1,10 @@
 import datetime
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Iterator, Optional
 
 import humanize
 from Bio import SeqIO
@@ -10,6 +12,13 @@ from Bio import SeqIO
 from camel.app.io.tooliofile import ToolIOFile
 from camel.app.tools.blast.makeblastdb import MakeBlastDb
 from camel.app.tools.cdhit.cdhitest import CDHitEst, Cluster
+from camel.app.tools.mmseqs.mmseqslinclust import MMseqsLinclust
+
+# Buffer size used when streaming (potentially very large) FASTA files
+_FASTA_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Line width of the sequences in the FASTA output (same as Biopython's SeqIO)
+_FASTA_LINE_WIDTH = 60
 
 
 class DBHelper(object):
@@ -26,6 +35,7 @@ class DBHelper(object):
         self._db_name = db_name
         self._working_dir = working_dir
         self._informs = []
+        self._allele_by_seq_id = {}
 
     @property
     def informs(self) -> List[Dict[str, Any]]:
@@ -35,6 +45,14 @@ class DBHelper(object):
         """
         return self._informs
 
+    @property
+    def allele_by_seq_id(self) -> Dict[str, str]:
+        """
+        Returns the allele names by novel (seq_{number}) header, collected while standardizing the FASTA headers.
+        :return: Allele names by sequence id
+        """
+        return self._allele_by_seq_id
+
     def get_working_subdir(self, name: str) -> Path:
         """
         Returns the path to the given sub directory.
@@ -46,52 +64,42 @@ class DBHelper(object):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    def get_clusters_form_fasta(self, fasta_file: Path, clustering_cutoff: float) -> List[Cluster]:
+    def get_clusters_form_fasta(self, fasta_file: Path, clustering_cutoff: float, threads: int = 8,
+                                cluster_tool: str = 'cd-hit', informs: Optional[List[Dict[str, Any]]] = None) \
+            -> List[Cluster]:
         """
         Returns the clusters of similar sequences from the given FASTA file.
         :param fasta_file: Input FASTA file
         :param clustering_cutoff: Clustering cutoff (0.0 - 1.0)
+        :param threads: Number of threads to use
+        :param cluster_tool: Clustering tool ('cd-hit' or 'mmseqs')
+        :param informs: List to which the tool informs are added (default: the informs of this helper)
         :return: List of clusters
         """
-        cdhit = CDHitEst()
-        cdhit.update_parameters(identitiy_threshold=str(clustering_cutoff / 100))
-        cdhit.add_input_files({'FASTA': [ToolIOFile(fasta_file)]})
-        cdhit.run(self.get_working_subdir('clustering'))
-        self._informs.append(cdhit.informs)
-        return cdhit.informs['clusters']
+        if cluster_tool == 'cd-hit':
+            tool = CDHitEst()
+        elif cluster_tool == 'mmseqs':
+            tool = MMseqsLinclust()
+        else:
+            raise ValueError(f'Invalid clustering tool: {cluster_tool}')
+        tool.update_parameters(identitiy_threshold=str(clustering_cutoff / 100), threads=threads)
+        tool.add_input_files({'FASTA': [ToolIOFile(fasta_file)]})
+        tool.run(self.get_working_subdir('clustering'))
+        (self._informs if informs is None else informs).append(tool.informs)
+        return tool.informs['clusters']
 
-    def index_blast(self, fasta_file: Path, working_dir: Path) -> None:
+    def index_blast(self, fasta_file: Path, working_dir: Path, informs: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Indexes the given FASTA file with makeblastdb.
         :param fasta_file: Input FASTA file
         :param working_dir: Working directory
+        :param informs: List to which the tool informs are added (default: the informs of this helper)
         :return: None
         """
         makeblastdb = MakeBlastDb()
         makeblastdb.add_input_files({'FASTA': [ToolIOFile(fasta_file)]})
         makeblastdb.run(working_dir)
-        self._informs.append(makeblastdb.informs)
-
-    def convert_fasta_headers_to_seq(self, input_file: Path, output_file: Path) -> Dict[str, str]:
-        """
-        Creates a fasta file where all ids are replaced by seq_{number}.
-        This ensures that CD-HIT can work properly.
-        :param input_file: Input FASTA file
-        :param output_file: Output FASTA file
-        :return: Mapping of original headers to novel headers
-        """
-        seq_ids = {}
-        output_seqs = []
-        with input_file.open() as handle_in:
-            for seq in SeqIO.parse(handle_in, 'fasta'):
-                new_name = 'seq_{}'.format(len(seq_ids))
-                seq_ids[new_name] = seq.description
-                seq.id = new_name
-                seq.description = ''
-                output_seqs.append(seq)
-        with output_file.open('w') as handle_out:
-            SeqIO.write(output_seqs, handle_out, 'fasta')
-        return seq_ids
+        (self._informs if informs is None else informs).append(makeblastdb.informs)
 
     def export_metadata(self, name: str, dir_output: Path) -> None:
         """
@@ -107,26 +115,69 @@ class DBHelper(object):
             json.dump(metadata, handle, indent=4, sort_keys=True)
         logging.info(f"Metadata exported: {metadata_file}")
 
-    def standardize_fasta_headers(self, input_fasta: Path) -> Path:
+    def standardize_fasta_headers(self, input_fasta: Path, output_seq_headers: Path) -> Tuple[Path, Dict[str, str]]:
         """
-        Reformat the headers of the input FASTA file.
+        Reformats the headers of the input FASTA file in a single pass over the file. Two FASTA files are created:
+        - A FASTA file where the description is replaced by the allele information (JSON format)
+        - A FASTA file where all ids are replaced by seq_{number}, this ensures that CD-HIT can work properly.
         :param input_fasta: Input FASTA file
-        :return: Reformatted FASTA file
+        :param output_seq_headers: Output FASTA file with the seq_{number} headers
+        :return: Reformatted FASTA file, mapping of the novel headers to the reformatted headers
         """
         dir_reformat = self._working_dir / 'reformat'
-        if not dir_reformat.exists():
-            dir_reformat.mkdir()
+        dir_reformat.mkdir(exist_ok=True)
         output_path = dir_reformat / f'{Path(input_fasta).stem.lower()}.fasta'
-        with input_fasta.open() as handle:
-            seqs = list(SeqIO.parse(handle, 'fasta'))
-        for s in seqs:
-            data = {'allele': s.id}
-            s.description = json.dumps(data)
-        with output_path.open('w') as handle:
-            SeqIO.write(seqs, handle, 'fasta')
+        new_names, headers, alleles = [], [], []
+        with input_fasta.open('rb') as handle_in, \
+                output_path.open('wb', buffering=_FASTA_BUFFER_SIZE) as handle_out, \
+                output_seq_headers.open('wb', buffering=_FASTA_BUFFER_SIZE) as handle_out_seq:
+            if os.fstat(handle_in.fileno()).st_size > 0:
+                with mmap.mmap(handle_in.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    for i, (header, sequence) in enumerate(DBHelper.__iter_fasta_records(data)):
+                        parts = header.split(None, 1)
+                        seq_id = parts[0].decode() if len(parts) > 0 else ''
+                        header = f'{seq_id} {json.dumps({"allele": seq_id})}'
+                        new_name = f'seq_{i}'
+                        new_names.append(new_name)
+                        headers.append(header)
+                        alleles.append(seq_id)
+                        handle_out.write(f'>{header}\n'.encode())
+                        handle_out.write(sequence)
+                        handle_out_seq.write(f'>{new_name}\n'.encode())
+                        handle_out_seq.write(sequence)
         logging.info(
             f"Reformatted FASTA file created ({humanize.naturalsize(output_path.stat().st_size)}): {output_path}")
-        return output_path
+        self._allele_by_seq_id = dict(zip(new_names, alleles))
+        return output_path, dict(zip(new_names, headers))
+
+    @staticmethod
+    def __iter_fasta_records(data: mmap.mmap) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterates over the records of a memory-mapped FASTA file. Sequence blocks are sliced from the mapping as a
+        whole and normalized like Biopython's SeqIO: line breaks, carriage returns and spaces are removed and the
+        sequence is wrapped with '\n' line endings.
+        :param data: Memory-mapped FASTA file
+        :return: Iterator over the header (without '>') and the sequence block of each record
+        """
+        start = 0
+        if data[:1] != b'>':
+            start = data.find(b'\n>')
+            if start == -1:
+                return
+            start += 1
+        size = len(data)
+        while True:
+            header_end = data.find(b'\n', start)
+            if header_end == -1:
+                header_end = size
+            next_record = data.find(b'\n>', header_end)
+            end = size if next_record == -1 else next_record + 1
+            sequence = data[header_end + 1:end].translate(None, b' \r\n')
+            yield data[start + 1:header_end], b''.join(
+                sequence[i:i + _FASTA_LINE_WIDTH] + b'\n' for i in range(0, len(sequence), _FASTA_LINE_WIDTH))
+            if next_record == -1:
+                break
+            start = end
 
     def export_mapping(self, mapping: Dict[str, str], clusters: List[Cluster], output_directory: Path) -> None:
         """
@@ -136,8 +187,9 @@ class DBHelper(object):
         :param output_directory: Output directory
         :return: None
         """
-        with (output_directory / 'mapping.txt').open('w') as handle:
-            json.dump(mapping, handle, indent=4, sort_keys=True)
+        # The JSON is serialized in memory first, json.dump() issues a separate write call for every token
+        with (output_directory / 'mapping.txt').open('w', buffering=_FASTA_BUFFER_SIZE) as handle:
+            handle.write(json.dumps(mapping, indent=4, sort_keys=True))
         logging.info(f"Metadata exported: {output_directory}")
 
         cluster_by_seq_id = {}
@@ -155,8 +207,8 @@ class DBHelper(object):
             except KeyError:
                 continue
             seq_metadata[seq_id] = seq_data
-        with (output_directory / 'mapping_full.json').open('w') as handle:
-            json.dump(seq_metadata, handle, indent=2)
+        with (output_directory / 'mapping_full.json').open('w', buffering=_FASTA_BUFFER_SIZE) as handle:
+            handle.write(json.dumps(seq_metadata, indent=2))
 
     @staticmethod
     def create_srst2_fasta(input_fasta: Path, output_fasta: Path, clusters: List[Cluster]) -> None:
@@ -169,7 +221,7 @@ class DBHelper(object):
         :return: Path to generated FASTA file
         """
         seq_record_by_id = {}
-        with input_fasta.open() as handle_in:
+        with input_fasta.open(buffering=_FASTA_BUFFER_SIZE) as handle_in:
             for seq in SeqIO.parse(handle_in, 'fasta'):
                 seq_record_by_id[seq.id] = seq
                 seq.description = ''
@@ -182,5 +234,5 @@ class DBHelper(object):
                 seq.id = '__'.join([str(i), cluster.name, full_name, full_name])
                 output_seqs.append(seq)
 
-        with output_fasta.open('w') as handle_out:
+        with output_fasta.open('w', buffering=_FASTA_BUFFER_SIZE) as handle_out:
             SeqIO.write(output_seqs, handle_out, 'fasta')
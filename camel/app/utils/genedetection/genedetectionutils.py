@@ -5,7 +5,12 @@ from typing import Tuple, Dict, List
 
 import bs4
 import re
-from Bio import SeqIO
+
+# Gene detection header: '{sequence id} {metadata in JSON format}'
+_HEADER_RE = re.compile('^(.*) ({.*})$')
+
+# NCBI accession
+_NCBI_ACCESSION_RE = re.compile(r'\w{1,4}[\d.]+')
 
 
 class GeneDetectionUtils(object):
@@ -21,7 +26,7 @@ class GeneDetectionUtils(object):
         :param header: Complete header
         :return: sequence id, metadata
         """
-        m = re.match('^(.*) ({.*})$', header)
+        m = _HEADER_RE.match(header)
         if not m:
             raise ValueError("Invalid header: {}".format(header))
         metadata = json.loads(m.group(2))
@@ -34,7 +39,7 @@ class GeneDetectionUtils(object):
         :param accession: Accession
         :return: True if it is a NCBI accession
         """
-        m = re.match(r'\w{1,4}[\d.]+', accession)
+        m = _NCBI_ACCESSION_RE.match(accession)
         if m:
             return True
         return False
@@ -47,7 +52,7 @@ class GeneDetectionUtils(object):
         :param include_header: If True, header is included
         :return: Extracted content
         """
-        content = bs4.BeautifulSoup(html_code, 'html.parser')
+        content = bs4.BeautifulSoup(html_code, 'html.parser', parse_only=bs4.SoupStrainer('div'))
         parts = []
         for x in content.find('div').contents:
             if (include_header is False) and (x.name == 'h3'):
@@ -89,10 +94,13 @@ class GeneDetectionUtils(object):
         :return: Mapping of seq_NN to cluster
         """
         cluster_by_seq = {}
-        with open(clustered_fasta) as handle:
-            for seq in SeqIO.parse(handle, 'fasta'):
-                parts = seq.id.split('__')
-                cluster_by_seq[parts[2]] = parts[1]
+        with open(clustered_fasta, 'rb') as handle:
+            # Only the sequence ids are needed, so the sequences themselves are not parsed (or decoded)
+            for line in handle:
+                if not line.startswith(b'>'):
+                    continue
+                parts = line[1:].split(None, 1)[0].split(b'__')
+                cluster_by_seq[parts[2].decode('ascii')] = parts[1].decode('ascii')
         unique_clusters = set(cluster_by_seq.values())
         logging.info(f"Clustering mapping parsed for {len(cluster_by_seq)} sequences ({len(unique_clusters)} "
                      f"unique clusters)")
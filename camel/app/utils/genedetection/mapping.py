@@ -16,6 +16,7 @@ class Mapping(object):
         :param content: Mapping content
         """
         self._content = content
+        self._metadata_by_seq_id = {}
 
     @staticmethod
     def parse(input_file: Path) -> 'Mapping':
@@ -60,7 +61,11 @@ class Mapping(object):
         """
         if seq_id not in self._content:
             raise ValueError(f"No sample with id '{seq_id}' in mapping")
-        metadata = json.loads(' '.join(self._content[seq_id].split(' ')[1:]))
+        metadata = self._metadata_by_seq_id.get(seq_id)
+        if metadata is None:
+            _, _, metadata_str = self._content[seq_id].partition(' ')
+            metadata = json.loads(metadata_str)
+            self._metadata_by_seq_id[seq_id] = metadata
         if metadata_key not in metadata:
             if default is None:
                 raise ValueError(f"Key '{metadata_key}' not found in metadata")
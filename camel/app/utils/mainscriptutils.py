@@ -2,17 +2,22 @@
 Contains helper function for main scripts with a report output.
 """
 import argparse
-import collections
+import collections.abc
 import datetime
+from importlib.resources import files
 from pathlib import Path
 from typing import Optional, List, Any, Dict
 
-import pkg_resources
-
 from camel.app.utils.report.htmlreport import HtmlReport
 from camel.app.utils.report.htmlreportsection import HtmlReportSection
 from camel.app.utils.snakemake.snakepipelineutils import SnakePipelineUtils
 
+_JQUERY_SRC = Path(str(files('camel').joinpath('resources/jquery-3.2.1.min.js')))
+_CSS_STYLE = Path(str(files('camel').joinpath('resources/style.css')))
+
+# Characters that are removed from input file names
+_SANITIZE_TABLE = str.maketrans('', '', '/!@#$\\"')
+
 
 def generate_analysis_info_section(
         args: argparse.Namespace, additional_info: Optional[List[List[str]]] = None) -> HtmlReportSection:
@@ -23,13 +28,14 @@ def generate_analysis_info_section(
     :return: Analysis info section
     """
     section = HtmlReportSection('Analysis info')
-    input_files = args.fasta.name if args.fasta_name is None else args.fasta_name
+    arg_values = vars(args)
+    input_files = arg_values['fasta'].name if arg_values['fasta_name'] is None else arg_values['fasta_name']
     data = [
         ('Analysis date:', datetime.datetime.now().strftime(SnakePipelineUtils.DATE_FORMAT)),
         ('Input file(s):', input_files),
     ]
-    if ('read_type' in args) and (args.read_type is not None):
-        read_type = args.read_type if ('fasta' in args) and (args.fasta is None) else 'NA'
+    if arg_values.get('read_type') is not None:
+        read_type = arg_values['read_type'] if ('fasta' in arg_values) and (arg_values['fasta'] is None) else 'NA'
         data.append(('Read type:', read_type))
     if additional_info is not None:
         data.extend(additional_info)
@@ -45,12 +51,9 @@ def init_report(output_path: Path, output_dir: Path, title: str, header: str) ->
     :param header: Report header
     :return: Report
     """
-    jquery_src = pkg_resources.resource_filename('camel', 'resources/jquery-3.2.1.min.js')
-    report = HtmlReport(output_path, output_dir, [Path(jquery_src)])
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True)
-    css_style = pkg_resources.resource_filename('camel', 'resources/style.css')
-    report.initialize(title, Path(css_style))
+    report = HtmlReport(output_path, output_dir, [_JQUERY_SRC])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report.initialize(title, _CSS_STYLE)
     report.add_pipeline_header(header)
     report.save()
     return report
@@ -65,27 +68,27 @@ def prepare_galaxy_output(output_dir: Path, output_html: Path) -> None:
     :param output_html: Output report path
     :return: None
     """
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True)
-    if output_html.exists():
-        output_html.unlink()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_html.unlink(missing_ok=True)
 
 
 def dict_merge(dct: Dict[str, Any], merge_dct) -> None:
     """
-    Recursive dict merge. Inspired by :meth:``dict.update()``, instead of updating only top-level keys,
-    dict_merge recurses down into dicts nested to an arbitrary depth, updating keys. The ``merge_dct`` is merged into
+    Nested dict merge. Inspired by :meth:``dict.update()``, instead of updating only top-level keys,
+    dict_merge descends into dicts nested to an arbitrary depth, updating keys. The ``merge_dct`` is merged into
     ``dct`` (https://gist.github.com/angstwad/bf22d1822c38a92ec0a9).
     :param dct: dict onto which the merge is executed
     :param merge_dct: dct merged into dct
     :return: None
     """
-    for k, v in merge_dct.items():
-        if (k in dct and isinstance(dct[k], dict)
-                and isinstance(merge_dct[k], collections.Mapping)):
-            dict_merge(dct[k], merge_dct[k])
-        else:
-            dct[k] = merge_dct[k]
+    stack = [(dct, merge_dct)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            if isinstance(target.get(k), dict) and isinstance(v, collections.abc.Mapping):
+                stack.append((target[k], v))
+            else:
+                target[k] = v
 
 
 def sanitize_input_name(name: str, extension: str) -> str:
@@ -95,8 +98,6 @@ def sanitize_input_name(name: str, extension: str) -> str:
     :param extension: Expected file extension (e.g., 'bam' or 'fasta')
     :return: None
     """
-    invalid_chars = '/!@#$\\"'
-
     # Replace spaces by dashes
     name = name.replace(' ', '_')
 
@@ -105,7 +106,7 @@ def sanitize_input_name(name: str, extension: str) -> str:
         name = name[:-1]
 
     # Add extension
-    name = ''.join(c for c in name if c not in invalid_chars)
+    name = name.translate(_SANITIZE_TABLE)
     if not name.endswith(f'.{extension}'):
         return f'{name}.{extension}'
 
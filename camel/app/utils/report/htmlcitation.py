@@ -1,11 +1,12 @@
 import json
-from pathlib import Path
+from importlib.resources import files
 from typing import Dict, Any
 
-import pkg_resources
-
 from camel.app.utils.report.htmlbase import HtmlBase
 
+# Directory with the citation JSON files
+_DIR_CITATIONS = files('camel').joinpath('resources/citations')
+
 
 class HtmlCitation(HtmlBase):
     """
@@ -69,8 +70,7 @@ class HtmlCitation(HtmlBase):
         :param json_basename: Basename for the JSON file
         :return: Citation
         """
-        json_citation = Path(pkg_resources.resource_filename(
-            'camel', str(Path('resources', 'citations', f'{json_basename}.json'))))
+        json_citation = _DIR_CITATIONS.joinpath(f'{json_basename}.json')
         with json_citation.open(encoding='utf-8') as handle:
             data = json.load(handle)
         return HtmlCitation(data)
@@ -25,6 +25,11 @@ class HtmlExpandableDiv(HtmlElement):
         }});        
     """
 
+    # Template without indentation and split on the id placeholder, so each script is created with a single join
+    SCRIPT_PARTS = '\n'.join(
+        line.strip() for line in SCRIPT_TEMPLATE.replace('{{', '{').replace('}}', '}').splitlines() if line.strip()
+    ).split('{id_}')
+
     def __init__(self, id_: str, label: str, attributes: List[Tuple[str, str]]=None):
         """
         Initializes an expandable div.
@@ -35,13 +40,17 @@ class HtmlExpandableDiv(HtmlElement):
         super().__init__('div', attributes=attributes)
         self._id = id_
         self._label = label
+        self._cached_html = None
 
     def to_html(self) -> str:
         """
         Converts this element to HTML code. A novel Doc() instance is created in order to nest the content of this
         elements Doc() inside the tag associated with this HtmlExpandableDiv.
+        The HTML code is only created once, the content should therefore be added before this method is called.
         :return: HTML code
         """
+        if self._cached_html is not None:
+            return self._cached_html
         doc, tag, text = Doc().tagtext()
         with tag('div'):
             with tag('p'):
@@ -54,5 +63,6 @@ class HtmlExpandableDiv(HtmlElement):
             with tag('div', id='content-{}'.format(self._id)):
                 doc.asis(self._doc.getvalue())
             with tag('script', type='text/javascript'):
-                text(HtmlExpandableDiv.SCRIPT_TEMPLATE.format(id_=self._id))
-        return doc.getvalue()
+                text(self._id.join(HtmlExpandableDiv.SCRIPT_PARTS))
+        self._cached_html = doc.getvalue()
+        return self._cached_html
@@ -1,10 +1,16 @@
-import string
-from typing import List, Optional
-
-import random
+import html
+import os
+from typing import List, Optional, Union
 
 from camel.app.utils.report.htmlbase import HtmlBase
 
+# Maps hex digits to lowercase letters, ids starting with a digit are not valid in the jQuery selectors
+_HEX_TO_LETTERS = str.maketrans('0123456789abcdef', 'abcdefghijklmnop')
+
+# Start tags for the rows that are always shown and for the rows that are hidden by default
+_ROW_START = '<tr>'
+_ROW_START_EXTRA = '<tr class="extra">'
+
 
 class HtmlExpandableTable(HtmlBase):
     """
@@ -29,6 +35,11 @@ class HtmlExpandableTable(HtmlBase):
     }});
     """
 
+    # Template without indentation and split on the id placeholder, so each script is created with a single join
+    SCRIPT_PARTS = '\n'.join(
+        line.strip() for line in SCRIPT_TEMPLATE.replace('{{', '{').replace('}}', '}').splitlines() if line.strip()
+    ).split('{id_}')
+
     def __init__(self, data: List[List], columns: List[str], nb_rows_shown: int = 5, id_: Optional[str] = None,
                  class_='data') -> None:
         """
@@ -46,10 +57,12 @@ class HtmlExpandableTable(HtmlBase):
             if columns is not None:
                 self._add_table_header(columns)
 
-            # Table content
-            for index, row in enumerate(data):
-                class_ = 'extra' if index > nb_rows_shown else None
-                self._add_table_row(row, [('class', class_)] if class_ else None)
+            # Table content (written at once, entering the yattag tags for every cell is slow for large tables)
+            nb_rows_first = max(nb_rows_shown + 1, 0)
+            self._doc.asis(''.join(
+                HtmlExpandableTable.__row_to_html(row, _ROW_START) for row in data[:nb_rows_first]))
+            self._doc.asis(''.join(
+                HtmlExpandableTable.__row_to_html(row, _ROW_START_EXTRA) for row in data[nb_rows_first:]))
 
             # Add control buttons
             if len(data) > nb_rows_shown:
@@ -67,7 +80,7 @@ class HtmlExpandableTable(HtmlBase):
         # Script to hide / show content
         if len(data) > nb_rows_shown:
             with self.get_tag('script', [('type', 'text/javascript')]):
-                self.add_text(HtmlExpandableTable.SCRIPT_TEMPLATE.format(id_=self._id))
+                self.add_text(self._id.join(HtmlExpandableTable.SCRIPT_PARTS))
 
     @staticmethod
     def create_random_id(size: int = 8) -> str:
@@ -76,4 +89,28 @@ class HtmlExpandableTable(HtmlBase):
         :param size: Size of the random string
         :return: Random id
         """
-        return ''.join(random.choices(string.ascii_lowercase, k=size))
+        return os.urandom((size + 1) // 2).hex()[:size].translate(_HEX_TO_LETTERS)
+
+    @staticmethod
+    def __row_to_html(row: List[Union[str, int, HtmlBase]], start_tag: str) -> str:
+        """
+        Converts a table row to HTML code.
+        :param row: Row data
+        :param start_tag: Start tag of the row
+        :return: HTML code
+        """
+        cells = []
+        for value in row:
+            if isinstance(value, HtmlBase):
+                cells.append(value.to_html())
+                continue
+            text = str(value)
+            if value is None or '<' in text or '&' in text:
+                # Markup and entities (and the error for missing values) are handled by add_text
+                cell = HtmlBase()
+                cell.add_text(value)
+                text = cell.to_html()
+            else:
+                text = html.escape(text, quote=False)
+            cells.append(f'<td>{text}</td>')
+        return f"{start_tag}{''.join(cells)}</tr>"
@@ -1,15 +1,16 @@
 import logging
+from importlib.resources import files
 from typing import Optional, List
 
 import shutil
 
 from pathlib import Path
 
-import pkg_resources
-
 from camel.app.utils.report.htmlbase import HtmlBase
 from camel.app.utils.report.htmlelement import HtmlElement
 
+_PATH_LOGO = Path(str(files('camel').joinpath('resources/logo-sciensano.png')))
+
 
 class HtmlReport(HtmlBase):
     """
@@ -79,7 +80,7 @@ class HtmlReport(HtmlBase):
         :param pipeline_name: Name of the pipeline
         :return: None
         """
-        path_logo = Path(pkg_resources.resource_filename('camel', 'resources/logo-sciensano.png'))
+        path_logo = _PATH_LOGO
         if self._output_dir is None:
             raise ValueError("Can't add the pipeline header without an output directory")
         with self.get_tag('div', [('class', 'header')]):
@@ -1,5 +1,9 @@
 import logging
+import mmap
+import os
 import pickle
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, List
 
@@ -8,6 +12,9 @@ from camel.app.io.tooliofile import ToolIOFile
 from camel.app.io.tooliovalue import ToolIOValue
 from camel.app.tools.tool import Tool
 
+# Shared pool for the IO-bound conversion and (de)serialization of the Snakemake input / output
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
 
 class SnakemakeUtils(object):
 
@@ -23,9 +30,9 @@ class SnakemakeUtils(object):
         :param path: Path to store the pickle
         :return: None
         """
-        logging.debug(f"Dumping object '{obj!r}' in file '{path}'")
-        with path.open('wb') as handle:
-            pickle.dump(obj, handle)
+        logging.debug("Dumping object '%r' in file '%s'", obj, path)
+        with open(path, 'wb', buffering=1 << 20) as handle:
+            pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
 
     @staticmethod
     def load_object(path: Path) -> Any:
@@ -34,12 +41,53 @@ class SnakemakeUtils(object):
         :param path: Path
         :return: Object
         """
-        logging.debug(f"Loading object from file '{path}'")
-        with path.open('rb') as handle:
-            obj = pickle.load(handle)
-        logging.debug(f"'{obj!r}' loaded")
+        logging.debug("Loading object from file '%s'", path)
+        with open(path, 'rb') as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                # Empty files cannot be mapped, pickle raises the usual EOFError for these
+                obj = pickle.load(handle)
+            else:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    obj = pickle.loads(mapped)
+        logging.debug("'%r' loaded", obj)
         return obj
 
+    @staticmethod
+    def __read_bytes(path: Path) -> bytes:
+        """
+        Reads the complete content of the given file without the buffered IO layer.
+        :param path: Path
+        :return: File content
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            while len(data) < size:
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def __write_bytes(path: Path, data: bytes) -> None:
+        """
+        Writes the given content to a file without the buffered IO layer.
+        :param path: Path
+        :param data: File content
+        :return: None
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
     @staticmethod
     def get_io_object(value: Any) -> Any:
         """
@@ -51,13 +99,17 @@ class SnakemakeUtils(object):
         :return: ToolIO object
         """
         path = Path(value)
-        if path.is_file():
-            converted_value = ToolIOFile(value)
-        elif path.is_dir():
-            converted_value = ToolIODirectory(value)
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            mode = None
+        if mode is not None and stat.S_ISREG(mode):
+            converted_value = ToolIOFile(path)
+        elif mode is not None and stat.S_ISDIR(mode):
+            converted_value = ToolIODirectory(path)
         else:
             converted_value = ToolIOValue(value)
-        logging.info(f"'{value}' converted to {converted_value!r}")
+        logging.debug("'%s' converted to %r", value, converted_value)
         return converted_value
 
     @staticmethod
@@ -70,10 +122,10 @@ class SnakemakeUtils(object):
         :param optional: True for optional input, False otherwise
         :return: None
         """
-        logging.debug(f"Adding pickled input with key '{key}' from file '{path}' to tool '{tool.name}'")
+        logging.debug("Adding pickled input with key '%s' from file '%s' to tool '%s'", key, path, tool.name)
         value = SnakemakeUtils.load_object(path)
         if optional and len(value) == 0:
-            logging.debug(f"Optional Input '{key}' empty, skipped")
+            logging.debug("Optional Input '%s' empty, skipped", key)
         else:
             tool.add_input_files({key: value})
 
@@ -86,8 +138,7 @@ class SnakemakeUtils(object):
         :param path: Pickle path
         :return: None
         """
-        logging.debug("Dumping output with key '{}' from tool '{}' to Camel IO pickle '{}'".format(
-            key, tool.name, path))
+        logging.debug("Dumping output with key '%s' from tool '%s' to Camel IO pickle '%s'", key, tool.name, path)
         if key not in tool.tool_outputs:
             raise KeyError(f"Tool '{tool.name}' has no output '{key}'")
         SnakemakeUtils.dump_object(tool.tool_outputs[key], path)
@@ -106,28 +157,34 @@ class SnakemakeUtils(object):
         :return: None
         """
         logging.info("Adding pickled inputs from snakemake input")
-        if optionals is None:
-            optionals = []
+        optionals = frozenset() if optionals is None else frozenset(optionals)
+        excluded_keys = frozenset() if excluded_keys is None else frozenset(excluded_keys)
+        valid_keys = frozenset(snake_input.keys())
         if keys is None:
             keys = snake_input.keys()
+        selected_keys = []
         for key in keys:
-            logging.debug(f"Adding input '{key}'")
-            if key not in snake_input.keys():
+            if key not in valid_keys:
                 raise KeyError(f"Key '{key}' not found in snakemake input")
-            if (excluded_keys is not None) and (key in excluded_keys):
+            if key in excluded_keys:
                 continue
-            with open(snake_input[key], 'rb') as handle:
-                value = pickle.load(handle)
+            selected_keys.append(key)
+
+        # Every key is stored in a separate pickle, so they are read concurrently
+        all_data = _IO_EXECUTOR.map(SnakemakeUtils.__read_bytes, [snake_input[key] for key in selected_keys])
+        for key, data in zip(selected_keys, all_data):
+            logging.debug("Adding input '%s'", key)
+            value = pickle.loads(data)
             if key.startswith('INFORMS'):
                 inform_key = '_'.join(key.split('_')[1:])
                 tool.add_input_informs({inform_key: value})
-                logging.debug(f"Informs '{value!r}' added")
+                logging.debug("Informs '%r' added", value)
             else:
                 if key in optionals and len(value) == 0:
-                    logging.debug(f"Optional Input '{key!r}' empty, skipped")
+                    logging.debug("Optional Input '%r' empty, skipped", key)
                     continue
                 tool.add_input_files({key: value})
-                logging.debug(f"Input '{value!r}' added")
+                logging.debug("Input '%r' added", value)
 
     @staticmethod
     def dump_tool_outputs(tool: Tool, snake_output: Any, keys: Optional[List[str]] = None,
@@ -143,13 +200,12 @@ class SnakemakeUtils(object):
         logging.info("Dumping tool outputs")
         if keys is None:
             keys = snake_output.keys()
+        outputs = []
         for key in keys:
             if key in tool.tool_outputs:
-                with open(snake_output[key], 'wb') as handle:
-                    pickle.dump(tool.tool_outputs[key], handle)
+                outputs.append((snake_output[key], tool.tool_outputs[key]))
             elif key == 'INFORMS':
-                with open(snake_output[key], 'wb') as handle:
-                    pickle.dump(tool.informs, handle)
+                outputs.append((snake_output[key], tool.informs))
             else:
                 message = f"Output '{key}' not generated"
                 if ignore_missing_output is True:
@@ -157,6 +213,13 @@ class SnakemakeUtils(object):
                 else:
                     raise ValueError(message)
 
+        # Every key is stored in a separate pickle, so they are written concurrently
+        futures = [_IO_EXECUTOR.submit(
+            SnakemakeUtils.__write_bytes, path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+            for path, obj in outputs]
+        for future in futures:
+            future.result()
+
     @staticmethod
     def pickle_snake_input(snake_input: Any, snake_output: Any, keys: Optional[List[str]] = None) -> None:
         """
@@ -168,17 +231,30 @@ class SnakemakeUtils(object):
         :param keys: If specified, only those keys are converted.
         :return: None
         """
-        logging.info(f"Converting snake input '{snake_input!r}' to pickles")
+        logging.info("Converting snake input '%r' to pickles", snake_input)
         if keys is None:
             keys = snake_input.keys()
+        valid_keys = frozenset(snake_input.keys())
+        valid_output_keys = frozenset(snake_output.keys())
+        input_lists = []
         for key in keys:
-            if key not in snake_input.keys():
+            if key not in valid_keys:
                 raise KeyError(f"Key '{key}' not found in snakemake input")
-            input_list = snake_input[key]
-            if key not in snake_output.keys():
+            if key not in valid_output_keys:
                 raise ValueError(f"Output key '{key}' not found.")
-            list_io_objects = [SnakemakeUtils.get_io_object(i) for i in input_list]
-            SnakemakeUtils.dump_object(list_io_objects, snake_output[key])
+            input_lists.append((key, list(snake_input[key])))
+
+        # Every conversion is a stat call and every key is written to a separate file, so both run concurrently
+        all_io_objects = list(_IO_EXECUTOR.map(
+            SnakemakeUtils.get_io_object, [value for _, input_list in input_lists for value in input_list]))
+        futures = []
+        start = 0
+        for key, input_list in input_lists:
+            list_io_objects = all_io_objects[start:start + len(input_list)]
+            start += len(input_list)
+            futures.append(_IO_EXECUTOR.submit(SnakemakeUtils.dump_object, list_io_objects, Path(snake_output[key])))
+        for future in futures:
+            future.result()
 
     @staticmethod
     def run_tool(tool: Tool, snake_input: Any, snake_output: Any, working_dir: Path) -> None:
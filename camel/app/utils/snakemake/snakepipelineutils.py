@@ -1,9 +1,15 @@
+import functools
+import html
+import json
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.resources import files
 from pathlib import Path
 from typing import List, Tuple, Any, Dict, Optional
 
-import pkg_resources
 import yaml
 
 from camel.app.error.snakemakeexecutionerror import SnakemakeExecutionError
@@ -12,11 +18,22 @@ from camel.app.io.tooliovalue import ToolIOValue
 from camel.app.utils.command import Command
 from camel.app.utils.fileutils import FileUtils
 from camel.app.utils.report.htmlcitation import HtmlCitation
-from camel.app.utils.report.htmlelement import HtmlElement
 from camel.app.utils.report.htmlreport import HtmlReport
 from camel.app.utils.report.htmlreportsection import HtmlReportSection
 from camel.app.utils.snakemake.snakemakeutils import SnakemakeUtils
 
+# Use the libyaml based dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+
+_JQUERY_SRC = Path(str(files('camel').joinpath('resources/jquery-3.2.1.min.js')))
+_CSS_STYLE = Path(str(files('camel').joinpath('resources/style.css')))
+
+# Input names recur between runs, so the sanitized names are cached
+_make_valid = functools.lru_cache(maxsize=4096)(FileUtils.make_valid)
+
+# Template for the items of the report overview list
+_OVERVIEW_ITEM_TEMPLATE = '<li><a href="#{key}">{title}</a></li>'
+
 
 class SnakePipelineUtils(object):
     """
@@ -31,10 +48,8 @@ class SnakePipelineUtils(object):
         Initializes an empty pipeline report.
         :return: Report
         """
-        css_style = Path(pkg_resources.resource_filename('camel', 'resources/style.css'))
-        jquery_src = Path(pkg_resources.resource_filename('camel', 'resources/jquery-3.2.1.min.js'))
-        report = HtmlReport(output_path, output_dir, [jquery_src])
-        report.initialize(pipeline_info['name'], css_style)
+        report = HtmlReport(output_path, output_dir, [_JQUERY_SRC])
+        report.initialize(pipeline_info['name'], _CSS_STYLE)
         report.add_pipeline_header(f"{pipeline_info['title']} {pipeline_info['version']}")
         return report
 
@@ -78,25 +93,38 @@ class SnakePipelineUtils(object):
         # Add the overview section
         report.add_module_header('Sections')
         section = HtmlReportSection(None)
-        overview_list = HtmlElement('ul')
-        for title, key, _ in report_structure:
-            list_item = HtmlElement('li')
-            list_item.add_html_object(HtmlElement('a', title, [('href', '#{}'.format(key))]))
-            overview_list.add_html_object(list_item)
-        section.add_html_object(overview_list)
+        section.add_raw('<ul>{}</ul>'.format(''.join(
+            _OVERVIEW_ITEM_TEMPLATE.format(key=html.escape(key), title=html.escape(title, quote=False))
+            for title, key, _ in report_structure)))
         report.add_html_object(section)
 
+        # Load the sections of all modules concurrently, the report itself is only updated from this thread
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sections = iter(list(executor.map(
+                SnakePipelineUtils.__load_report_section,
+                [pickle for _, _, items in report_structure for pickle in items])))
+
         # Add the different sections
         for title, key, items in report_structure:
             report.add_module_header(title, key)
-            for pickle in items:
-                if not pickle.exists():
+            for section in [next(sections) for _ in items]:
+                if section is None:
                     continue
-                section = SnakemakeUtils.load_object(pickle)[0].value
                 report.add_html_object(section)
                 section.copy_files(report.output_dir)
         report.save()
 
+    @staticmethod
+    def __load_report_section(pickle: Path) -> Optional[HtmlReportSection]:
+        """
+        Loads a report section from the given pickle.
+        :param pickle: Pickle path
+        :return: Report section, None if the pickle does not exist
+        """
+        if not pickle.exists():
+            return None
+        return SnakemakeUtils.load_object(pickle)[0].value
+
     @staticmethod
     def create_empty_report_section(title: str, output_file: Path, header_level: int = 3) -> None:
         """
@@ -125,31 +153,38 @@ class SnakePipelineUtils(object):
         if len(file_names) != len(file_paths):
             raise ValueError("File names ({}) and file paths ({}) should be the same length".format(
                 len(file_names), len(file_paths)))
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True)
-        links = []
-        for path, name in zip(file_paths, file_names):
-            link_path = output_dir / (FileUtils.make_valid(name) if sanitize else name)
-            if link_path.is_symlink():
-                link_path.unlink()
-            link_path.symlink_to(path)
-            links.append(link_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        links = [output_dir / (_make_valid(name) if sanitize else name) for name in file_names]
+        symlink = os.symlink
+        for path, link_path in zip(file_paths, links):
+            try:
+                symlink(path, link_path)
+            except FileExistsError:
+                # Links from a previous run are replaced
+                os.unlink(link_path)
+                symlink(path, link_path)
         return links
 
     @staticmethod
-    def generate_config_file(config_data: Dict[str, Any], output_dir: Path, output_basename: str = 'config.yml') -> str:
+    def generate_config_file(config_data: Dict[str, Any], output_dir: Path, output_basename: str = 'config.json') -> str:
         """
-        Generates a configuration file for Snakemake in YAML file format.
+        Generates a configuration file for Snakemake in JSON or YAML file format (based on the file extension).
+        The file is written to a temporary file first and then moved in place, so it is never read partially.
         :param config_data: Configuration data
         :param output_dir: Output directory
         :param output_basename: Output basename
         :return: Path to config file
         """
         config_path = output_dir / output_basename
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True)
-        with config_path.open('w') as handle:
-            yaml.dump(config_data, handle)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if config_path.suffix == '.json':
+            config_text = json.dumps(config_data, indent=2, sort_keys=True, default=str) + '\n'
+        else:
+            config_text = yaml.dump(config_data, Dumper=_YAML_DUMPER, default_flow_style=False)
+        path_tmp = config_path.with_name(f'.{config_path.name}.tmp')
+        with path_tmp.open('w') as handle:
+            handle.write(config_text)
+        os.replace(path_tmp, config_path)
         logging.info(f"Configuration file created: {config_path}")
         return str(config_path)
 
@@ -168,8 +203,7 @@ class SnakePipelineUtils(object):
         :param slurm_args: Dictionary of slurm arguments
         :return: None
         """
-        if not working_dir.exists():
-            working_dir.mkdir(parents=True)
+        working_dir.mkdir(parents=True, exist_ok=True)
 
         # Construct basic command
         command_parts = [
@@ -188,20 +222,24 @@ class SnakePipelineUtils(object):
 
         # Add slurm submit file and parameters if specified
         if slurm_args is not None:
-            command_parts.append(f'--cluster "{slurm_args["cluster"]}"')
+            command_parts.extend(['--cluster', str(slurm_args['cluster'])])
             for key, value in slurm_args.items():
                 if key != 'cluster':
-                    command_parts.append(f'--{key} {value}')
+                    command_parts.extend([f'--{key}', str(value)])
 
-        # Create and run command
-        command = Command(' '.join(command_parts))
-        command.run(working_dir)
+        # Create and run command (executed without a shell, so the arguments do not need quoting)
+        # The output is streamed to log files instead of being kept in memory
+        command = Command(command_parts)
+        path_stdout = working_dir / 'snakemake.log'
+        path_stderr = working_dir / 'snakemake.err'
+        with open(path_stdout, 'wb') as handle_stdout, open(path_stderr, 'wb') as handle_stderr:
+            command.run(working_dir, stderr_handle=handle_stderr, stdout_handle=handle_stdout)
         if command.returncode != 0:
-            logging.error(command.stderr)
-            logging.error(command.stdout)
-            print(command.stdout)
-            print(command.stderr)
-            raise SnakemakeExecutionError(command.stdout, command.stderr)
+            stdout = path_stdout.read_text(errors='replace')
+            stderr = path_stderr.read_text(errors='replace')
+            logging.error(stderr)
+            logging.error(stdout)
+            raise SnakemakeExecutionError(stdout, stderr)
         return command
 
     @staticmethod
@@ -214,12 +252,14 @@ class SnakePipelineUtils(object):
         """
         section = HtmlReportSection('Commands')
         logging.debug(f"Exporting command for {len(tool_informs)} tools")
+        # The working directory, the line breaks and the HTML special characters are replaced in a single pass
+        pattern = re.compile(f'{re.escape(str(working_dir))}|[\n&<>]')
+        replacements = {str(working_dir): '$WORKING', '\n': '<br />\n', '&': '&amp;', '<': '&lt;', '>': '&gt;'}
         for informs in tool_informs:
             header = f"{informs['_name']} - {informs['_tag']}" if '_tag' in informs else informs['_name']
             section.add_header(header, 3)
-            command_txt = informs['_command'].replace(str(working_dir), '$WORKING')
-            command_txt = command_txt.replace('\n', '<br />\n')
-            section.add_html_object(HtmlElement('code', command_txt, [('class', 'command')]))
+            command_txt = pattern.sub(lambda match: replacements[match.group()], informs['_command'])
+            section.add_raw(f'<code class="command">{command_txt}</code>')
         return section
 
     @staticmethod
@@ -255,7 +295,10 @@ class SnakePipelineUtils(object):
                 except KeyError:
                     logging.warning(f"No '{key_orig}' input found")
         elif key_se is not None:
-            se_reads = io.get('SE_FWD', []) + io.get('SE_REV', [])
+            se_reads = []
+            for key in ('SE_FWD', 'SE_REV'):
+                if key in io:
+                    se_reads.extend(io[key])
             output_dict[key_se] = se_reads
         else:
             logging.debug(f"No key(s) provided for SE reads")
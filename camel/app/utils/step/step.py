@@ -62,8 +62,14 @@ class Step(object):
         self._folder = folder
         self._pipeline_output = pipeline_output
         self._wildcards = wildcards
-        self._keys_log = keys_log
-        self._keys_no_log = keys_no_log
+        self._keys_log = frozenset(keys_log) if keys_log is not None else None
+        self._keys_no_log = frozenset(keys_no_log) if keys_no_log is not None else None
+        if self._keys_log is not None:
+            self._log_predicate = self._keys_log.__contains__
+        elif self._keys_no_log is not None:
+            self._log_predicate = lambda key: key not in self._keys_no_log
+        else:
+            self._log_predicate = lambda key: True
 
     @property
     def name(self) -> str:
@@ -153,9 +159,4 @@ class Step(object):
         :param key: Output key to check
         :return: True/False
         """
-        if (self._keys_log is None) and (self._keys_no_log is None):
-            return True
-        elif self._keys_log is not None:
-            return key in self._keys_log
-        else:
-            return key not in self._keys_no_log
+        return self._log_predicate(key)
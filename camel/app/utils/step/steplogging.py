@@ -4,13 +4,19 @@ from pathlib import Path
 
 import yaml
 
+# Use the libyaml based loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class StepLogging(object):
     """
     Manages the various logs.
     """
+    _ROOT = logging.getLogger()
     _step_handlers = []
     _pipeline_handlers = []
+    _step_folder = None
+    _pipeline_folder = None
 
     @staticmethod
     def initialize(config_file: Path):
@@ -20,10 +26,20 @@ class StepLogging(object):
         :return: None
         """
         with open(config_file, 'rt') as f:
-            config = yaml.safe_load(f.read())
+            config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
         logging.config.dictConfig(config)
-        StepLogging._step_handlers = [h for h in logging.getLogger().handlers if h.get_name().startswith('step')]
-        StepLogging._pipeline_handlers = [h for h in logging.getLogger().handlers if h.get_name().startswith('pipeline')]
+        step_handlers = []
+        pipeline_handlers = []
+        for handler in StepLogging._ROOT.handlers:
+            name = handler.get_name()
+            if name.startswith('step'):
+                step_handlers.append(handler)
+            elif name.startswith('pipeline'):
+                pipeline_handlers.append(handler)
+        StepLogging._step_handlers = step_handlers
+        StepLogging._pipeline_handlers = pipeline_handlers
+        StepLogging._step_folder = None
+        StepLogging._pipeline_folder = None
         StepLogging.detach_step_handlers()
         StepLogging.detach_pipeline_handlers()
         logging.info("Log manager initialized")
@@ -35,11 +51,17 @@ class StepLogging(object):
         :param folder: Folder to store the logs
         :return: None
         """
+        if folder == StepLogging._step_folder:
+            # The handlers already log to this folder, so their files are kept open
+            for step_handler in StepLogging._step_handlers:
+                StepLogging._ROOT.addHandler(step_handler)
+            return
+        StepLogging._step_folder = folder
         for step_handler in StepLogging._step_handlers:
             filename = Path(step_handler.baseFilename).name
             step_handler.close()
             step_handler.baseFilename = str(folder / filename)
-            logging.getLogger().addHandler(step_handler)
+            StepLogging._ROOT.addHandler(step_handler)
 
     @staticmethod
     def detach_step_handlers() -> None:
@@ -47,9 +69,8 @@ class StepLogging(object):
         Detaches the step handlers.
         :return: None
         """
-        for step_handler in StepLogging._step_handlers:
-            if step_handler in logging.getLogger().handlers:
-                logging.getLogger().handlers.remove(step_handler)
+        targets = {id(handler) for handler in StepLogging._step_handlers}
+        StepLogging._ROOT.handlers = [h for h in StepLogging._ROOT.handlers if id(h) not in targets]
 
     @staticmethod
     def attach_pipeline_handlers(folder: Path) -> None:
@@ -58,11 +79,17 @@ class StepLogging(object):
         :param folder: Folder to store the logs
         :return: None
         """
+        if folder == StepLogging._pipeline_folder:
+            # The handlers already log to this folder, so their files are kept open
+            for pipeline_handler in StepLogging._pipeline_handlers:
+                StepLogging._ROOT.addHandler(pipeline_handler)
+            return
+        StepLogging._pipeline_folder = folder
         for pipeline_handler in StepLogging._pipeline_handlers:
             filename = Path(pipeline_handler.baseFilename).name
             pipeline_handler.close()
             pipeline_handler.baseFilename = str(folder / filename)
-            logging.getLogger().addHandler(pipeline_handler)
+            StepLogging._ROOT.addHandler(pipeline_handler)
 
     @staticmethod
     def detach_pipeline_handlers() -> None:
@@ -70,6 +97,5 @@ class StepLogging(object):
         Detaches the pipeline handlers.
         :return: None
         """
-        for pipeline_handler in StepLogging._pipeline_handlers:
-            if pipeline_handler in logging.getLogger().handlers:
-                logging.getLogger().handlers.remove(pipeline_handler)
+        targets = {id(handler) for handler in StepLogging._pipeline_handlers}
+        StepLogging._ROOT.handlers = [h for h in StepLogging._ROOT.handlers if id(h) not in targets]
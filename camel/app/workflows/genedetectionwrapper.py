@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -11,12 +10,37 @@ from camel.app.utils.snakemake.snakepipelineutils import SnakePipelineUtils
 from camel.snakefiles import gene_detection
 
 
-@dataclass
-class GeneDetectionOutput:
-    report_section: HtmlReportSection
-    detected_hits: List[GeneDetectionHitBase]
-    informs: Dict[str, Any]
-    log_file: Optional[Path] = None
+class GeneDetectionOutput(object):
+    """
+    Output of the gene detection workflow, the detected hits are only loaded when they are accessed.
+    """
+
+    __slots__ = ('report_section', 'informs', 'log_file', '_hits_path', '_hits')
+
+    def __init__(self, report_section: HtmlReportSection, hits_path: Path, informs: Dict[str, Any],
+                 log_file: Optional[Path] = None) -> None:
+        """
+        Initializes the gene detection output.
+        :param report_section: Report section
+        :param hits_path: Path to the pickle with the detected hits
+        :param informs: Informs
+        :param log_file: Log file (optional)
+        """
+        self.report_section = report_section
+        self.informs = informs
+        self.log_file = log_file
+        self._hits_path = hits_path
+        self._hits = None
+
+    @property
+    def detected_hits(self) -> List[GeneDetectionHitBase]:
+        """
+        Returns the detected hits, they are loaded on first access.
+        :return: Detected hits
+        """
+        if self._hits is None:
+            self._hits = [v.value for v in SnakemakeUtils.load_object(self._hits_path)]
+        return self._hits
 
 
 class GeneDetectionWrapper(object):
@@ -30,6 +54,7 @@ class GeneDetectionWrapper(object):
         :param working_dir: Working directory
         """
         self._working_dir = working_dir
+        self._working_dir_str = str(working_dir)
         self._output = None
 
     def __run_workflow(self, config_data: Dict[str, Any], threads: int) -> None:
@@ -99,8 +124,7 @@ class GeneDetectionWrapper(object):
         :return: None
         """
         path = self._working_dir / str(gene_detection.INPUT_GENE_DETECTION_FASTA).format(db='db')
-        if not path.parent.exists():
-            path.parent.mkdir(parents=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
         SnakemakeUtils.dump_object([ToolIOFile(fasta_path)], path)
 
     def __create_input_srst2(self, fastq_input: FastqInput) -> None:
@@ -126,7 +150,7 @@ class GeneDetectionWrapper(object):
         :return: Config data
         """
         return {
-            'working_dir': str(self._working_dir),
+            'working_dir': self._working_dir_str,
             'sample_name': sample_name,
             'detection_method': detection_method,
             'gene_detection': {'db': db_data},
@@ -142,7 +166,7 @@ class GeneDetectionWrapper(object):
         log_file_path = self._working_dir / 'camel.log'
         self._output = GeneDetectionOutput(
             report_section=SnakemakeUtils.load_object(output_files['report'])[0].value,
-            detected_hits=[v.value for v in SnakemakeUtils.load_object(output_files['hits'])],
+            hits_path=output_files['hits'],
             informs=SnakemakeUtils.load_object(output_files['informs']),
             log_file=log_file_path if log_file_path.exists() else None
         )
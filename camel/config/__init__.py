@@ -1,12 +1,34 @@
+import functools
 from importlib.resources import files
 from pathlib import Path
+from typing import Any, Dict
 
 import yaml
 
 _path_config = str(files('camel').joinpath('config/config.yml'))
 
-if not Path(_path_config).exists():
-    raise FileNotFoundError(f'Config file not found: {_path_config}\nA sample file is available in {Path(_path_config).parent}')
+# Use the libyaml based loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-with open(_path_config) as handle:
-    config = yaml.load(handle, Loader=yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Dict[str, Any]:
+    """
+    Returns the CAMEL configuration, the configuration file is only parsed on first access.
+    :return: Configuration
+    """
+    if not Path(_path_config).exists():
+        raise FileNotFoundError(f'Config file not found: {_path_config}\nA sample file is available in {Path(_path_config).parent}')
+    with open(_path_config, 'rb') as handle:
+        return yaml.load(handle, Loader=_YAML_SAFE_LOADER)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Loads the configuration when the 'config' attribute is first accessed (e.g. 'from camel.config import config').
+    :param name: Attribute name
+    :return: Attribute value
+    """
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,6 +1,4 @@
 from camel.app import loggingutils
-from camel.scripts.maingenedetection import MainGeneDetection
-from camel.scripts.mainmakegenedetectiondb import MainMakeGeneDetectionDB
 
 
 def main_gene_detection() -> None:
@@ -8,16 +6,29 @@ def main_gene_detection() -> None:
     Entry point for main gene detection script.
     :return: None
     """
+    from camel.scripts.maingenedetection import MainGeneDetection
     loggingutils.initialize_logging()
     main = MainGeneDetection()
     main.run()
 
 
+def main_gene_detection_batch() -> None:
+    """
+    Entry point for the batch gene detection script.
+    :return: None
+    """
+    from camel.scripts.maingenedetectionbatch import MainGeneDetectionBatch
+    loggingutils.initialize_logging()
+    main = MainGeneDetectionBatch()
+    main.run()
+
+
 def main_create_db() -> None:
     """
     Entry point for main gene detection script.
     :return: None
     """
+    from camel.scripts.mainmakegenedetectiondb import MainMakeGeneDetectionDB
     loggingutils.initialize_logging()
     main = MainMakeGeneDetectionDB()
     main.run()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import argparse
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
@@ -97,7 +98,11 @@ class MainGeneDetection(object):
             path_symlink = Path(
                 self._args.working_dir, 'input', mainscriptutils.sanitize_input_name(self._sample_name, 'fasta'))
             path_symlink.parent.mkdir(parents=True, exist_ok=True)
-            path_symlink.symlink_to(self._args.fasta)
+            link_target = os.readlink(path_symlink) if path_symlink.is_symlink() else None
+            if link_target != str(self._args.fasta):
+                # Links from a previous run that point to another file (or regular files at its path) are replaced
+                path_symlink.unlink(missing_ok=True)
+                path_symlink.symlink_to(self._args.fasta)
             self._args.fasta = path_symlink
 
         # Initialize the report
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from camel.app import loggingutils
+from camel.app.utils.fileutils import FileUtils
+from camel.scripts.maingenedetection import MainGeneDetection
+from camel.version import __version__
+
+
+def _run_sample(sample_args: List[str]) -> None:
+    """
+    Runs the gene detection for a single sample (executed in a worker process).
+    :param sample_args: Command line arguments for the gene detection script
+    :return: None
+    """
+    main = MainGeneDetection(sample_args)
+    main.run()
+
+
+class MainGeneDetectionBatch(object):
+    """
+    This class is used to run the gene detection tool on multiple samples in parallel.
+    """
+
+    def __init__(self, args: Optional[Sequence[str]] = None) -> None:
+        """
+        Initializes the main script.
+        :param args: Arguments (optional)
+        """
+        self._args = MainGeneDetectionBatch.parse_arguments(args)
+
+    @staticmethod
+    def parse_arguments(args: Optional[Sequence[str]]) -> argparse.Namespace:
+        """
+        Parses the command line arguments.
+        :return: Parsed arguments
+        """
+        argument_parser = argparse.ArgumentParser()
+
+        # General arguments
+        argument_parser.add_argument(
+            '--samples-tsv', required=True, type=Path,
+            help='TSV file with the FASTA file, sample name and output directory of every sample (no header)')
+        argument_parser.add_argument('--working-dir', default=Path.cwd(), type=Path, help='Working directory for temporary files')
+        argument_parser.add_argument('--threads-per-sample', default=4, type=int, help='Number of threads to use per sample')
+        argument_parser.add_argument('--database-dir', type=Path, required=True, help='Input database directory')
+
+        # BLAST-specific parameters
+        argument_parser.add_argument('--blast-min-percent-identity', type=int, default=90, help='Minimum percent identity')
+        argument_parser.add_argument('--blast-min-percent-coverage', type=int, default=60, help='Minimum percent target coverage')
+        argument_parser.add_argument('--blast-task', type=str, choices=['blastn', 'megablast'], default='megablast', help="Value of the blast '-task' parameter")
+
+        # Version
+        argument_parser.add_argument(
+            '--version', help='Print version and exit', action='version', version=f'Gene detection {__version__}')
+        return argument_parser.parse_args(args)
+
+    def parse_samples(self) -> List[List[str]]:
+        """
+        Parses the samples TSV file into the command line arguments for every sample.
+        :return: List of command line arguments
+        """
+        samples_args = []
+        working_dirs = set()
+        with self._args.samples_tsv.open() as handle:
+            for line in handle:
+                if not line.strip() or line.startswith('#'):
+                    continue
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) != 3:
+                    raise ValueError(f"Invalid line in samples TSV (expected 3 columns): {line.strip()}")
+                fasta, sample_name, output_dir = parts
+                working_dir = self._args.working_dir / FileUtils.make_valid(sample_name)
+                if working_dir in working_dirs:
+                    raise ValueError(f"Sample name '{sample_name}' results in a duplicate working directory: {working_dir}")
+                working_dirs.add(working_dir)
+                samples_args.append([
+                    '--fasta', fasta,
+                    '--fasta-name', sample_name,
+                    '--output-dir', output_dir,
+                    '--working-dir', str(working_dir),
+                    '--database-dir', str(self._args.database_dir),
+                    '--threads', str(self._args.threads_per_sample),
+                    '--blast-min-percent-identity', str(self._args.blast_min_percent_identity),
+                    '--blast-min-percent-coverage', str(self._args.blast_min_percent_coverage),
+                    '--blast-task', self._args.blast_task
+                ])
+        return samples_args
+
+    def run(self) -> None:
+        """
+        Runs the main script.
+        :return: None
+        """
+        samples_args = self.parse_samples()
+        max_workers = max(1, (os.cpu_count() or 1) // self._args.threads_per_sample)
+        logging.info(f'Running gene detection on {len(samples_args)} samples ({max_workers} in parallel)')
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(_run_sample, sample_args) for sample_args in samples_args]:
+                future.result()
+
+
+if __name__ == '__main__':
+    loggingutils.initialize_logging()
+    main = MainGeneDetectionBatch()
+    main.run()
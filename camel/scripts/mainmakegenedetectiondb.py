@@ -1,20 +1,20 @@
 #!/usr/bin/env python
 import argparse
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Optional, Sequence, TYPE_CHECKING, List, Dict, Any
 
 from camel.app import loggingutils
-from camel.app.tools.blast.makeblastdb import MakeBlastDb
-from camel.app.tools.cdhit.cdhitest import CDHitEst
-from camel.app.utils import mainscriptutils
-from camel.app.utils.genedetection.dbhelper import DBHelper
-from camel.app.utils.genedetection.genedetectionutils import GeneDetectionUtils
-from camel.app.utils.report.htmlreport import HtmlReport
-from camel.app.utils.report.htmlreportsection import HtmlReportSection
-from camel.app.utils.snakemake.snakepipelineutils import SnakePipelineUtils
+
+# The tool, report and Snakemake modules are imported where they are used, so '--help' returns without loading them
+if TYPE_CHECKING:
+    from camel.app.utils.report.htmlreportsection import HtmlReportSection
+
+_CSS_STYLE = Path(str(files('camel').joinpath('resources/style.css')))
 
 
 class MainMakeGeneDetectionDB(object):
@@ -28,10 +28,13 @@ class MainMakeGeneDetectionDB(object):
         :param args: (Optional) arguments
         """
         self._args = MainMakeGeneDetectionDB.parse_arguments(args)
+        from camel.app.utils import mainscriptutils
+        from camel.app.utils.genedetection.dbhelper import DBHelper
         fasta_name = self._args.fasta_name if self._args.fasta_name is not None else self._args.fasta.name
         self._db_name = mainscriptutils.sanitize_input_name(fasta_name, 'fasta')
         self._helper = DBHelper(self._db_name, self._args.working_dir)
         self._clusters = None
+        self._db_size = None
         self._new_name_by_header = None
 
     def _check_dependencies(self) -> None:
@@ -39,8 +42,15 @@ class MainMakeGeneDetectionDB(object):
         Checks if the required dependencies are available.
         :return: None
         """
+        from camel.app.tools.blast.makeblastdb import MakeBlastDb
+        from camel.app.tools.cdhit.cdhitest import CDHitEst
+        from camel.app.tools.mmseqs.mmseqslinclust import MMseqsLinclust
         logging.info("Checking dependencies")
-        tools = {'blast': MakeBlastDb, 'CD-HIT': CDHitEst}
+        tools = {'blast': MakeBlastDb}
+        if self._args.cluster_tool == 'mmseqs':
+            tools['MMseqs2'] = MMseqsLinclust
+        else:
+            tools['CD-HIT'] = CDHitEst
 
         # Run commands to see if tools are available
         for key, Tool_class in tools.items():
@@ -60,6 +70,7 @@ class MainMakeGeneDetectionDB(object):
         argument_parser.add_argument('--fasta', type=Path, required=True, help='Input FASTA file.')
         argument_parser.add_argument('--fasta-name', help='Name of the input FASTA file (for Galaxy input).')
         argument_parser.add_argument('--identity-cutoff', default=80, type=int, help='Clustering identity cutoff, entries with a higher value are combined into a single cluster.')
+        argument_parser.add_argument('--cluster-tool', choices=['cd-hit', 'mmseqs'], default='cd-hit', help='Tool used to cluster the input sequences.')
         argument_parser.add_argument('--output-html', type=Path, help='Output HTML file with database construction information.')
         argument_parser.add_argument('--output-dir', type=Path, required=True, help='Output directory.')
         argument_parser.add_argument('--working-dir', default=Path.cwd(), type=Path, help='Working directory for temporary files.')
@@ -74,43 +85,51 @@ class MainMakeGeneDetectionDB(object):
         self._check_dependencies()
         if not self._args.output_dir.exists():
             self._args.output_dir.mkdir(parents=True)
-        input_fasta = self._helper.standardize_fasta_headers(self._args.fasta)
-        self.__export_blast_db(input_fasta, self._args.output_dir)
-        self.__export_srst2_db(input_fasta, self._args.output_dir)
+        fasta_seq_headers = self._helper.get_working_subdir('clustering') / 'seq_headers.fasta'
+        input_fasta, self._new_name_by_header = self._helper.standardize_fasta_headers(
+            self._args.fasta, fasta_seq_headers)
+        # Both exports write to disjoint files and mainly wait on external tools, so they are run concurrently
+        # Each export collects its own tool informs, these are added in a fixed order afterwards
+        informs_blast, informs_srst2 = [], []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.__export_blast_db, input_fasta, self._args.output_dir, informs_blast),
+                executor.submit(self.__export_srst2_db, fasta_seq_headers, self._args.output_dir, informs_srst2)
+            ]
+            for future in futures:
+                future.result()
+        self._helper.informs.extend(informs_blast + informs_srst2)
         self._helper.export_metadata(self._db_name, self._args.output_dir)
         self.__export_report()
 
-    def __export_blast_db(self, input_fasta: Path, output_dir: Path) -> None:
+    def __export_blast_db(self, input_fasta: Path, output_dir: Path, informs: List[Dict[str, Any]]) -> None:
         """
         Creates and exports a gene detection BLAST database from the given FASTA file.
         :param input_fasta: Input FASTA file
         :param output_dir: Output directory
+        :param informs: List to which the tool informs are added
         :return: None
         """
-        # Create file
-        dir_indexing = self._helper.get_working_subdir('index_blast')
-        new_path = dir_indexing / input_fasta.name
+        # Create file (copied, as the reformatted FASTA in the working directory is rewritten on a rerun)
+        # The index is created next to the FASTA file in the output directory
+        new_path = output_dir / input_fasta.name
         shutil.copyfile(str(input_fasta), str(new_path))
 
         # Index
-        self._helper.index_blast(new_path, dir_indexing)
+        self._helper.index_blast(new_path, output_dir, informs)
 
-        # Export files
-        for f in dir_indexing.iterdir():
-            shutil.copyfile(str(f), str(output_dir / f.name))
-
-    def __export_srst2_db(self, input_fasta: Path, output_dir: Path) -> None:
+    def __export_srst2_db(self, fasta_seq_headers: Path, output_dir: Path, informs: List[Dict[str, Any]]) -> None:
         """
         Exports a database for SRST2.
-        :param input_fasta: Input FASTA file
+        :param fasta_seq_headers: Input FASTA file with the seq_{number} headers
         :param output_dir: Output directory
+        :param informs: List to which the tool informs are added
         :return: None
         """
         # Cluster FASTA
-        dir_clustering = self._helper.get_working_subdir('clustering')
-        fasta_seq_headers = dir_clustering / 'seq_headers.fasta'
-        self._new_name_by_header = self._helper.convert_fasta_headers_to_seq(input_fasta, fasta_seq_headers)
-        self._clusters = self._helper.get_clusters_form_fasta(fasta_seq_headers, self._args.identity_cutoff)
+        self._clusters = self._helper.get_clusters_form_fasta(
+            fasta_seq_headers, self._args.identity_cutoff, self._args.threads, self._args.cluster_tool, informs)
+        self._db_size = sum(len(c.seq_ids) for c in self._clusters)
 
         # Create SRST2 FASTA
         dir_indexing = self._helper.get_working_subdir('index_srst2')
@@ -118,15 +137,16 @@ class MainMakeGeneDetectionDB(object):
         self._helper.create_srst2_fasta(fasta_seq_headers, fasta_srst2, self._clusters)
 
         # Index
-        self._helper.index_blast(fasta_srst2, dir_indexing)
+        self._helper.index_blast(fasta_srst2, dir_indexing, informs)
 
         # Export files
         self._helper.export_mapping(self._new_name_by_header, self._clusters, output_dir)
-        for f in dir_indexing.iterdir():
-            if f.is_file():
-                shutil.copyfile(str(f), str(output_dir / f.name))
-            elif f.is_dir():
-                shutil.copytree(str(f), str(output_dir / f.name))
+        with os.scandir(dir_indexing) as it:
+            for entry in it:
+                if entry.is_file():
+                    shutil.copyfile(entry.path, str(output_dir / entry.name))
+                elif entry.is_dir():
+                    shutil.copytree(entry.path, str(output_dir / entry.name))
 
     def __export_report(self) -> None:
         """
@@ -135,41 +155,43 @@ class MainMakeGeneDetectionDB(object):
         """
         if self._args.output_html is None:
             self._args.output_html = self._args.output_dir / 'report.html'
+        from camel.app.utils.report.htmlreport import HtmlReport
+        from camel.app.utils.snakemake.snakepipelineutils import SnakePipelineUtils
         self._report = HtmlReport(self._args.output_html, self._args.output_dir)
-        path_css = Path(str(files('camel').joinpath('resources/style.css')))
-        self._report.initialize('Gene detection database', path_css)
+        self._report.initialize('Gene detection database', _CSS_STYLE)
         self._report.add_html_object(self.__create_db_info_section())
         self._report.add_html_object(self.__create_clusters_section())
         self._report.add_html_object(SnakePipelineUtils.create_commands_section(
             self._helper.informs, self._args.working_dir))
         self._report.save()
 
-    def __create_db_info_section(self) -> HtmlReportSection:
+    def __create_db_info_section(self) -> 'HtmlReportSection':
         """
         Creates the report section with the database info.
         :return: HTML report section
         """
+        from camel.app.utils.report.htmlreportsection import HtmlReportSection
         section_db_info = HtmlReportSection('Database info')
         section_db_info.add_table([
             ['Name:', self._db_name],
-            ['Size:', sum(len(c.seq_ids) for c in self._clusters)],
+            ['Size:', self._db_size],
             ['Nb. clusters:', len(self._clusters)],
             ['Clustering cutoff: ', f'{self._args.identity_cutoff}%']
         ], table_attributes=[('class', 'information')])
         return section_db_info
 
-    def __create_clusters_section(self) -> HtmlReportSection:
+    def __create_clusters_section(self) -> 'HtmlReportSection':
         """
         Creates the report section with the cluster information.
         :return: HTML report section
         """
+        from camel.app.utils.report.htmlreportsection import HtmlReportSection
         section_clusters = HtmlReportSection('Clusters')
-        allele_by_seq_id = {
-            s: GeneDetectionUtils.parse_header(h)[1]['allele'] for s, h in self._new_name_by_header.items()}
+        allele_by_seq_id = self._helper.allele_by_seq_id
         table_data = [[
             cluster.name,
             len(cluster.seq_ids),
-            ', '.join([allele_by_seq_id[s] for s in cluster.seq_ids])
+            ', '.join(allele_by_seq_id[s] for s in cluster.seq_ids)
         ] for cluster in self._clusters]
         section_clusters.add_table(table_data, ['Cluster', 'Size', 'Sequence ids'], [('class', 'data')])
         return section_clusters
@@ -21,12 +21,13 @@ rule gene_detection_blast_blastn:
     params:
         running_dir = lambda wildcards: Path(config['working_dir']) / 'gene_detection' / wildcards.db / 'blastn',
         task = lambda wildcards: config['gene_detection'][wildcards.db].get('params', {}).get('blastn', {}).get('task', 'megablast')
+    threads: workflow.cores
     run:
         from camel.app.tools.blast.blastn import Blastn
         blastn = Blastn()
         SnakemakeUtils.add_pickle_inputs(blastn, input)
         step = Step(str(rule), blastn, Path(str(params.running_dir)), wildcards)
-        blastn.update_parameters(threads=1, task=str(params.task), max_target_seqs=20000)
+        blastn.update_parameters(threads=threads, task=str(params.task), max_target_seqs=20000)
         step.run_step()
         blastn.informs['Task'] = params.task
         SnakemakeUtils.dump_tool_outputs(blastn, output)
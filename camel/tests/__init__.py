@@ -0,0 +1,35 @@
+import functools
+import os
+import shutil
+from pathlib import Path
+
+from camel.config import config
+
+# Minimum free space required to use the tmpfs scratch directory
+_MIN_FREE_TMPFS = 1 << 30
+
+
+@functools.lru_cache(maxsize=None)
+def get_dir_temp() -> Path:
+    """
+    Returns the scratch directory for the tests. A tmpfs directory is used if it is writable and has enough free space
+    (location can be set using the 'CAMEL_TMP' environment variable, default: /dev/shm), otherwise the configured
+    temporary directory is used.
+    :return: Scratch directory
+    """
+    dir_tmpfs = Path(os.environ.get('CAMEL_TMP', '/dev/shm'))
+    try:
+        if os.access(dir_tmpfs, os.W_OK) and shutil.disk_usage(dir_tmpfs).free > _MIN_FREE_TMPFS:
+            return dir_tmpfs
+    except OSError:
+        pass
+    return Path(config['dir_temp'])
+
+
+def is_tmpfs(path: Path) -> bool:
+    """
+    Checks if the given test directory is located in the tmpfs scratch directory (instead of the configured one).
+    :param path: Path
+    :return: True if the directory is located on the tmpfs
+    """
+    return get_dir_temp() != Path(config['dir_temp']) and path.parent == get_dir_temp()
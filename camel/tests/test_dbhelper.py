@@ -0,0 +1,108 @@
+import json
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from typing import Tuple
+
+from Bio import SeqIO
+
+from camel.app.utils.genedetection.dbhelper import DBHelper
+from camel.tests import get_dir_temp
+
+
+class TestDBHelper(unittest.TestCase):
+    """
+    Tests the FASTA reformatting of the gene detection database helper.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up the resources before running the test.
+        :return: None
+        """
+        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', str(get_dir_temp())))
+
+    def tearDown(self) -> None:
+        """
+        Cleans up the resources after running the test.
+        :return: None
+        """
+        shutil.rmtree(self.running_dir, ignore_errors=True)
+
+    @staticmethod
+    def __reformat_seqio(input_fasta: Path) -> Tuple[str, str]:
+        """
+        Reformats the given FASTA file with Biopython (the original implementation of the helper).
+        :param input_fasta: Input FASTA file
+        :return: Reformatted FASTA, FASTA with the seq_{number} headers
+        """
+        with input_fasta.open() as handle:
+            seqs = list(SeqIO.parse(handle, 'fasta'))
+        for seq in seqs:
+            seq.description = json.dumps({'allele': seq.id})
+        handle_out = StringIO()
+        SeqIO.write(seqs, handle_out, 'fasta')
+        reformatted = handle_out.getvalue()
+
+        seqs = list(SeqIO.parse(StringIO(reformatted), 'fasta'))
+        for i, seq in enumerate(seqs):
+            seq.id = f'seq_{i}'
+            seq.description = ''
+        handle_out = StringIO()
+        SeqIO.write(seqs, handle_out, 'fasta')
+        return reformatted, handle_out.getvalue()
+
+    def __check_standardize_fasta_headers(self, content: bytes) -> None:
+        """
+        Checks that the reformatted FASTA files are identical to the ones created with Biopython.
+        :param content: Content of the input FASTA file
+        :return: None
+        """
+        input_fasta = self.running_dir / 'input.fasta'
+        input_fasta.write_bytes(content)
+        helper = DBHelper('test', self.running_dir)
+        output_seq_headers = self.running_dir / 'seq_headers.fasta'
+        output_fasta, mapping = helper.standardize_fasta_headers(input_fasta, output_seq_headers)
+        expected_fasta, expected_seq_headers = TestDBHelper.__reformat_seqio(input_fasta)
+        self.assertEqual(output_fasta.read_text(), expected_fasta)
+        self.assertEqual(output_seq_headers.read_text(), expected_seq_headers)
+        self.assertEqual(mapping, {
+            f'seq_{i}': seq.description for i, seq in enumerate(SeqIO.parse(StringIO(expected_fasta), 'fasta'))})
+
+    def test_standardize_fasta_headers_wrapped(self) -> None:
+        """
+        Tests the reformatting of a FASTA file with sequences wrapped at different widths and blank lines.
+        :return: None
+        """
+        self.__check_standardize_fasta_headers(
+            b'>gene_a desc a\n' + b'ACGT' * 10 + b'\n' + b'ACGT' * 25 + b'\n\n' +
+            b'>gene_b\nACG\nTTA\n\nGGC\n' +
+            b'>gene_c desc c\n' + b'A' * 120 + b'\n' +
+            b'>gene_d\n' + b'C' * 61)
+
+    def test_standardize_fasta_headers_crlf(self) -> None:
+        """
+        Tests the reformatting of a FASTA file with Windows line endings and spaces in the sequence lines.
+        :return: None
+        """
+        self.__check_standardize_fasta_headers(
+            b'>gene_a desc a\r\n' + b'ACGT ' * 20 + b'\r\n' + b'TTGA\r\n\r\n' +
+            b'>gene_b\r\nACG\r\nTT A\r\n')
+
+    def test_standardize_fasta_headers_empty_id(self) -> None:
+        """
+        Tests that records with an empty header get an empty allele name.
+        :return: None
+        """
+        input_fasta = self.running_dir / 'input.fasta'
+        input_fasta.write_bytes(b'>\nACGT\n>gene_b\nTTGA\n')
+        helper = DBHelper('test', self.running_dir)
+        _, mapping = helper.standardize_fasta_headers(input_fasta, self.running_dir / 'seq_headers.fasta')
+        self.assertEqual(helper.allele_by_seq_id, {'seq_0': '', 'seq_1': 'gene_b'})
+        self.assertEqual(mapping['seq_0'], ' {"allele": ""}')
+
+
+if __name__ == '__main__':
+    unittest.main()
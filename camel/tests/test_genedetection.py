@@ -1,33 +1,50 @@
 import logging
+import shutil
 import tempfile
 import unittest
 from importlib.resources import files
 from pathlib import Path
 
+import pytest
+
 from camel.app.loggingutils import initialize_logging
-from camel.config import config
 from camel.scripts.maingenedetection import MainGeneDetection
+from camel.tests import get_dir_temp, is_tmpfs
+
+_DATA = files('camel') / 'data'
+
+# Number of threads per test (fixed, the tests can be run in parallel with pytest-xdist)
+THREADS = '4'
 
 
 class TestGeneDetection(unittest.TestCase):
     """
     Tests the gene detection workflow.
     """
-    FASTA_IN = Path(str(files('camel').joinpath('data/assembly_subset.fasta')))
-    FASTA_IN_GALAXY = Path(str(files('camel').joinpath('data/dataset_000.dat')))
-    DB_IN = Path(str(files('camel').joinpath('data/db_amr')))
+    FASTA_IN = Path(str(_DATA.joinpath('assembly_subset.fasta')))
+    FASTA_IN_GALAXY = Path(str(_DATA.joinpath('dataset_000.dat')))
+    DB_IN = Path(str(_DATA.joinpath('db_amr')))
 
     def setUp(self) -> None:
         """
         Sets up the resources before running the test.
         :return: None
         """
-        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', config['dir_temp']))
+        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', str(get_dir_temp())))
         logging.debug(f"Directory for testing: {self.running_dir}")
 
+    def tearDown(self) -> None:
+        """
+        Cleans up the resources after running the test (only for tmpfs directories, to limit memory usage).
+        :return: None
+        """
+        if is_tmpfs(self.running_dir):
+            shutil.rmtree(self.running_dir, ignore_errors=True)
+
     ###############
     # FASTA input #
     ###############
+    @pytest.mark.smoke
     def test_gene_detection_blast_fasta(self) -> None:
         """
         Tests the gene detection workflow with BLAST detection on FASTA input.
@@ -40,6 +57,7 @@ class TestGeneDetection(unittest.TestCase):
             '--output-html', str(path_report_out),
             '--output-dir', str(path_report_out.parent),
             '--working-dir', str(self.running_dir),
+            '--threads', THREADS
         ]
         main = MainGeneDetection(args)
         main.run()
@@ -57,7 +75,8 @@ class TestGeneDetection(unittest.TestCase):
             '--database-dir', str(TestGeneDetection.DB_IN),
             '--output-html', str(path_report_out),
             '--output-dir', str(path_report_out.parent),
-            '--working-dir', str(self.running_dir)
+            '--working-dir', str(self.running_dir),
+            '--threads', THREADS
         ]
         main = MainGeneDetection(args)
         main.run()
@@ -75,7 +94,8 @@ class TestGeneDetection(unittest.TestCase):
             '--database-dir', str(TestGeneDetection.DB_IN),
             '--output-html', str(path_report_out),
             '--output-dir', str(path_report_out.parent),
-            '--working-dir', str(self.running_dir)
+            '--working-dir', str(self.running_dir),
+            '--threads', THREADS
         ]
         main = MainGeneDetection(args)
         main.run()
@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+from camel.scripts.maingenedetectionbatch import MainGeneDetectionBatch
+from camel.tests import get_dir_temp
+
+
+class TestGeneDetectionBatch(unittest.TestCase):
+    """
+    Tests the parsing of the samples TSV file of the batch gene detection tool.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up the resources before running the test.
+        :return: None
+        """
+        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', str(get_dir_temp())))
+
+    def tearDown(self) -> None:
+        """
+        Cleans up the resources after running the test.
+        :return: None
+        """
+        shutil.rmtree(self.running_dir, ignore_errors=True)
+
+    def __create_batch(self, lines: List[str]) -> MainGeneDetectionBatch:
+        """
+        Creates the batch script for a samples TSV file with the given lines.
+        :param lines: Lines of the samples TSV file
+        :return: Batch script
+        """
+        samples_tsv = self.running_dir / 'samples.tsv'
+        samples_tsv.write_text(''.join(f'{line}\n' for line in lines))
+        return MainGeneDetectionBatch([
+            '--samples-tsv', str(samples_tsv),
+            '--working-dir', str(self.running_dir / 'work'),
+            '--database-dir', str(self.running_dir / 'db'),
+            '--threads-per-sample', '2'
+        ])
+
+    def test_parse_samples(self) -> None:
+        """
+        Tests the conversion of the samples TSV file into the command line arguments for every sample.
+        :return: None
+        """
+        batch = self.__create_batch([
+            '# fasta\tname\toutput', '', 'a.fasta\tsample A\tout_a', 'b.fasta\tsample_b\tout_b'])
+        samples_args = batch.parse_samples()
+        self.assertEqual(len(samples_args), 2)
+        self.assertEqual(samples_args[0], [
+            '--fasta', 'a.fasta',
+            '--fasta-name', 'sample A',
+            '--output-dir', 'out_a',
+            '--working-dir', str(self.running_dir / 'work' / 'sample_A'),
+            '--database-dir', str(self.running_dir / 'db'),
+            '--threads', '2',
+            '--blast-min-percent-identity', '90',
+            '--blast-min-percent-coverage', '60',
+            '--blast-task', 'megablast'
+        ])
+        self.assertEqual(samples_args[1][samples_args[1].index('--working-dir') + 1], str(self.running_dir / 'work' / 'sample_b'))
+
+    def test_parse_samples_invalid_columns(self) -> None:
+        """
+        Tests that lines with an invalid number of columns are rejected.
+        :return: None
+        """
+        batch = self.__create_batch(['a.fasta\tsample_a'])
+        with self.assertRaises(ValueError):
+            batch.parse_samples()
+
+    def test_parse_samples_duplicate_working_dir(self) -> None:
+        """
+        Tests that sample names resulting in the same working directory are rejected.
+        :return: None
+        """
+        batch = self.__create_batch(['a.fasta\tsample a\tout_a', 'b.fasta\tsample_a\tout_b'])
+        with self.assertRaises(ValueError):
+            batch.parse_samples()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,20 @@
 import logging
+import shutil
 import tempfile
 import unittest
 from importlib.resources import files
 from pathlib import Path
 
+import pytest
+
 from camel.app.loggingutils import initialize_logging
-from camel.config import config
 from camel.scripts.mainmakegenedetectiondb import MainMakeGeneDetectionDB
+from camel.tests import get_dir_temp, is_tmpfs
+
+_DATA = files('camel') / 'data'
+
+# Number of threads per test (fixed, the tests can be run in parallel with pytest-xdist)
+THREADS = '4'
 
 
 class TestMakeDB(unittest.TestCase):
@@ -14,16 +22,25 @@ class TestMakeDB(unittest.TestCase):
     Tests the gene detection create DB tool.
     """
 
-    FASTA_IN = Path(str(files('camel').joinpath('data/db_amr/amr_subset.fasta')))
+    FASTA_IN = Path(str(_DATA.joinpath('db_amr/amr_subset.fasta')))
 
     def setUp(self) -> None:
         """
         Sets up the resources before running the test.
         :return: None
         """
-        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', config['dir_temp']))
+        self.running_dir = Path(tempfile.mkdtemp(None, 'camel_', str(get_dir_temp())))
         logging.debug(f"Directory for testing: {self.running_dir}")
 
+    def tearDown(self) -> None:
+        """
+        Cleans up the resources after running the test (only for tmpfs directories, to limit memory usage).
+        :return: None
+        """
+        if is_tmpfs(self.running_dir):
+            shutil.rmtree(self.running_dir, ignore_errors=True)
+
+    @pytest.mark.smoke
     def test_gene_detection_create_db(self) -> None:
         """
         Tests the gene detection create db main script.
@@ -34,7 +51,8 @@ class TestMakeDB(unittest.TestCase):
             '--output-html', str(output_file_report),
             '--output-dir', str(output_file_report.parent),
             '--fasta', str(TestMakeDB.FASTA_IN),
-            '--working-dir', str(self.running_dir)
+            '--working-dir', str(self.running_dir),
+            '--threads', THREADS
         ]
         main = MainMakeGeneDetectionDB(args)
         main.run()
@@ -52,7 +70,7 @@ class TestMakeDB(unittest.TestCase):
             '--fasta', str(TestMakeDB.FASTA_IN),
             '--fasta-name', '"spaces in name.fasta"',
             '--working-dir', str(self.running_dir),
-            '--threads', '4'
+            '--threads', THREADS
         ]
         main = MainMakeGeneDetectionDB(args)
         main.run()
@@ -23,9 +23,17 @@ setup(
         "Programming Language :: Python :: 3",
     ],
     keywords='gene detection blast kma',
-    packages=find_packages() + ['camel.resources', 'camel.snakefiles', 'camel.data'],
+    packages=find_packages(include=['camel', 'camel.*']),
     python_requires='>=3',
-    include_package_data=True,
+    package_data={
+        'camel': [
+            'app/tools/**/*.yml',
+            'config/config.yml.sample',
+            'data/**/*',
+            'resources/**/*'
+        ],
+        'camel.snakefiles': ['*.smk']
+    },
     install_requires=[
         'PyYAML==6.0.2',
         'beautifulsoup4==4.12.3',
@@ -38,6 +46,7 @@ setup(
     entry_points={
         'console_scripts': [
             'gene_detection=camel.scripts.__init__:main_gene_detection',
+            'gene_detection_batch=camel.scripts.__init__:main_gene_detection_batch',
             'gene_detection_create_db=camel.scripts.__init__:main_create_db',
         ],
     }